@@ -10,21 +10,30 @@ Combines pattern matching with semantic analysis (WordNet) and AI models (transf
 import os
 import re
 import json
+import atexit
+import hashlib
+import heapq
 import tkinter as tk
 from tkinter import ttk, messagebox
 from collections import defaultdict
+from functools import lru_cache
 from typing import List, Tuple, Dict
 from datetime import datetime
-from threading import Thread
+from threading import Thread, Event, Lock
 import webbrowser
 
 # Natural Language Processing imports
 import nltk
 from nltk.corpus import wordnet
-from nltk.tokenize import word_tokenize
 from nltk.stem import WordNetLemmatizer
+from nltk.tokenize import NLTKWordTokenizer
 
 # Optional AI/ML imports with graceful fallback
+try:
+    import numpy as np  # Also vectorizes pattern matching when available
+except ImportError:
+    np = None
+
 try:
     import torch
     from transformers import pipeline  # For text generation
@@ -35,6 +44,89 @@ except ImportError:
     SentenceTransformer = None
     util = None
 
+try:
+    from optimum.onnxruntime import ORTModelForFeatureExtraction  # For int8 CPU inference
+    from transformers import AutoTokenizer
+except ImportError:
+    ORTModelForFeatureExtraction = None
+    AutoTokenizer = None
+
+# Dictionary entries usable as crossword answers (letters only)
+_ANSWER_RE = re.compile(r"^[A-Z]+$")
+# Trie key marking a complete word; never collides with an uppercase letter
+_WORD_END = "$"
+# Word splitter for clues and definitions; callers only need letter runs
+_TOKEN_RE = re.compile(r"[A-Za-z]+")
+# word_tokenize's word splitter, minus the Punkt sentence split (clues are one sentence);
+# the AI length boost counts its tokens, punctuation and enumerations like "(5)" included
+_CLUE_TOKENIZER = NLTKWordTokenizer()
+# Sentence embedding model; also tags the on-disk embedding cache
+SIMILARITY_MODEL = 'all-MiniLM-L6-v2'
+# Optional int8 ONNX export of the same model (tokenizer + quantized weights), used on CPU
+ONNX_MODEL_DIR = 'all-MiniLM-L6-v2-int8'
+ONNX_MODEL_FILE = 'model_quantized.onnx'
+# New embedding rows held in memory before the first save (later saves wait for the cache to double)
+EMBEDDING_FLUSH_ROWS = 4096
+
+# Fetch NLTK data only when it is missing, once per process
+for _resource, _path in (('wordnet', 'corpora/wordnet'), ('omw-1.4', 'corpora/omw-1.4')):
+    try:
+        nltk.data.find(_path)
+    except LookupError:
+        nltk.download(_resource, quiet=True)
+
+_LEMMATIZER = WordNetLemmatizer()
+
+@lru_cache(maxsize=50000)
+def _lemma(word):
+    """Memoized WordNet lemmatization of a lowercase token"""
+    return _LEMMATIZER.lemmatize(word)
+
+@lru_cache(maxsize=2048)
+def _token_set(text):
+    """Frozen set of lemmatized word tokens in a clue or definition"""
+    return frozenset(_lemma(w) for w in _TOKEN_RE.findall(text.lower()))
+
+@lru_cache(maxsize=None)
+def _name_tokens(name):
+    """Frozen set of lemmatized parts of a synset name such as 'cat.n.01'"""
+    return frozenset(_lemma(w.lower()) for w in name.split('.'))
+
+@lru_cache(maxsize=1024)
+def _pattern_regex(pattern):
+    """Memoized pattern -> regex conversion; module-level so the cache holds no solver"""
+    if not pattern or pattern.strip() == "":
+        return r"^[A-Z]{2,15}$"  # Default range for word length if no pattern
+    regex = "".join("[A-Z]" if not c.isalpha() else c.upper() for c in pattern)
+    return f"^{regex}$"  # Enforce exact length with ^ and $
+
+class OnnxSentenceEncoder:
+    """SentenceTransformer-style encode() over an int8 ONNX Runtime export of MiniLM"""
+    cache_tag = SIMILARITY_MODEL + '-int8'
+
+    def __init__(self, model_dir):
+        self.tokenizer = AutoTokenizer.from_pretrained(model_dir)
+        self.model = ORTModelForFeatureExtraction.from_pretrained(model_dir, file_name=ONNX_MODEL_FILE)
+
+    def encode(self, sentences, convert_to_tensor=False, convert_to_numpy=True,
+               batch_size=32, show_progress_bar=False):
+        single = isinstance(sentences, str)
+        if single:
+            sentences = [sentences]
+        chunks = []
+        for start in range(0, len(sentences), batch_size):
+            inputs = self.tokenizer(sentences[start:start + batch_size], padding=True,
+                                    truncation=True, max_length=256, return_tensors='pt')
+            hidden = self.model(**inputs).last_hidden_state
+            # Mean pooling over real tokens, then L2 normalize, as SBERT does for MiniLM
+            mask = inputs['attention_mask'].unsqueeze(-1).to(hidden.dtype)
+            pooled = (hidden * mask).sum(dim=1) / mask.sum(dim=1).clamp(min=1e-9)
+            chunks.append(torch.nn.functional.normalize(pooled, dim=1))
+        embeddings = torch.cat(chunks)
+        if single:
+            embeddings = embeddings[0]
+        return embeddings if convert_to_tensor else embeddings.numpy()
+
 class CrosswordSolver:
     """Core crossword solving engine with enhanced clue-based ranking"""
     
@@ -42,18 +134,70 @@ class CrosswordSolver:
         self.word_list = self.load_word_database(word_file)
         if not self.word_list:
             raise FileNotFoundError("Word list not loaded. Exiting.")
+        # Lookup structures so pattern queries only touch words of the right length
+        self.word_set = set(self.word_list)
+        self.words_by_len: Dict[int, List[str]] = defaultdict(list)
+        for word in self.word_list:
+            if _ANSWER_RE.match(word):
+                self.words_by_len[len(word)].append(word)
+        # What the blank-pattern regex ^[A-Z]{2,15}$ matched, kept in dictionary order for tie-breaks
+        self.blank_matches = [w for w in self.word_list if 2 <= len(w) <= 15 and _ANSWER_RE.match(w)]
+        # Fixed-width byte arrays parallel to each bucket; tries are the fallback without NumPy
+        self.buckets_np = {}
+        if np is not None:
+            self.buckets_np = {length: np.array(words, dtype=f'S{length}')
+                               for length, words in self.words_by_len.items()}
+        self.bitsets: Dict[int, Dict[Tuple[int, str], "np.ndarray"]] = {}
+        self.tries: Dict[int, dict] = {}
+        # Corrections are appended to a log next to the (legacy) JSON snapshot
+        self.feedback_log = os.path.splitext(feedback_file)[0] + ".log"
         self.feedback_db = self.load_feedback_database(feedback_file)
-        self.excluded_words = []
+        self.excluded_words = set()
         self.current_results = None
-        self.generator = self._init_generator()
-        self.similarity_model = self._init_similarity_model()
-        self.lemmatizer = WordNetLemmatizer()
-        #nltk.download('punkt', quiet=True)
-        nltk.download('wordnet', quiet=True)
+        # Per-session caches: the word list and WordNet never change while running
+        self._synset_cache: Dict[str, list] = {}
+        self._word_bags: Dict[str, Tuple[frozenset, Dict[str, int], Dict[str, int], str]] = {}
+        # Ranked results per query; cleared whenever feedback or the ranker changes
+        self._compute = lru_cache(maxsize=512)(self._compute_uncached)
+        # AI models load in the background; ranking falls back to WordNet until then
+        self._generator = None  # DistilGPT2 is only loaded if something asks for it
+        self.similarity_model = None
+        # Embedding cache: definition hash -> row of _emb_matrix, whose capacity can exceed
+        # len(_emb_rows). Rows are append-only and guarded by _emb_lock; _emb_saved rows are on disk
+        self._emb_rows, self._emb_matrix = {}, None
+        self._emb_saved = 0
+        self._emb_lock = Lock()
+        self._emb_tag = SIMILARITY_MODEL
+        atexit.register(self._save_embedding_cache)
+        self.models_ready = Event()
+        self.on_models_ready = None
+        Thread(target=self._load_models_async, daemon=True).start()
+
+    def _load_models_async(self):
+        """Load the similarity model off the calling thread, then notify on_models_ready"""
+        similarity_model = self._init_similarity_model()
+        if similarity_model:
+            self._emb_tag = getattr(similarity_model, 'cache_tag', SIMILARITY_MODEL)
+            self._emb_rows, self._emb_matrix = self._load_embedding_cache()
+            self._emb_saved = len(self._emb_rows)
+        self.similarity_model = similarity_model
+        self._compute.cache_clear()
+        self.models_ready.set()
+        if self.on_models_ready:
+            self.on_models_ready()
+
+    @property
+    def generator(self):
+        if self._generator is None:
+            self._generator = self._init_generator()
+        return self._generator
 
     def _init_generator(self):
         if torch and pipeline:
             try:
+                if torch.cuda.is_available():
+                    return pipeline("text-generation", model="distilgpt2", device=0,
+                                    torch_dtype=torch.float16)
                 return pipeline("text-generation", model="distilgpt2", device=-1)
             except Exception as e:
                 print(f"Failed to load generator: {e}")
@@ -62,11 +206,109 @@ class CrosswordSolver:
     def _init_similarity_model(self):
         if SentenceTransformer and util:
             try:
-                return SentenceTransformer('all-MiniLM-L6-v2')
+                device = 'cuda' if torch.cuda.is_available() else 'cpu'
+                if device == 'cpu':
+                    encoder = self._init_onnx_encoder()
+                    if encoder:
+                        return encoder
+                model = SentenceTransformer(SIMILARITY_MODEL, device=device)
+                if device == 'cuda':
+                    model.half()  # FP16 halves memory traffic on GPU
+                    # FP16 embeddings differ from FP32 ones, so they get their own disk cache
+                    model.cache_tag = SIMILARITY_MODEL + '-fp16'
+                return model
             except Exception as e:
                 print(f"Failed to load similarity model: {e}")
         return None
 
+    def _init_onnx_encoder(self):
+        script_dir = os.path.dirname(os.path.abspath(__file__))
+        model_dir = os.path.join(script_dir, ONNX_MODEL_DIR)
+        if ORTModelForFeatureExtraction and AutoTokenizer and os.path.isdir(model_dir):
+            try:
+                return OnnxSentenceEncoder(model_dir)
+            except Exception as e:
+                print(f"Failed to load ONNX similarity model: {e}")
+        return None
+
+    def _load_embedding_cache(self):
+        """Memory-map cached definition embeddings if they were built by the current model"""
+        script_dir = os.path.dirname(os.path.abspath(__file__))
+        try:
+            with open(os.path.join(script_dir, "embeddings_index.json"), 'r') as f:
+                index = json.load(f)
+            if index.get("model") != self._emb_tag:
+                return {}, None
+            matrix = np.load(os.path.join(script_dir, "embeddings.npy"), mmap_mode='r')
+            rows = index["rows"]
+            if len(rows) > len(matrix):
+                return {}, None  # Index names rows the matrix does not have
+            return rows, matrix
+        except (FileNotFoundError, json.JSONDecodeError, KeyError, ValueError):
+            return {}, None
+
+    def _save_embedding_cache(self):
+        """Write rows added since the last save; the matrix goes first, so the index never runs ahead"""
+        with self._emb_lock:
+            count = len(self._emb_rows)
+            if count == self._emb_saved:
+                return
+            script_dir = os.path.dirname(os.path.abspath(__file__))
+            matrix_path = os.path.join(script_dir, "embeddings.npy")
+            index_path = os.path.join(script_dir, "embeddings_index.json")
+            try:
+                with open(matrix_path + ".tmp", 'wb') as f:
+                    np.save(f, self._emb_matrix[:count])
+                os.replace(matrix_path + ".tmp", matrix_path)
+                with open(index_path + ".tmp", 'w') as f:
+                    json.dump({"model": self._emb_tag, "rows": self._emb_rows}, f)
+                os.replace(index_path + ".tmp", index_path)
+                self._emb_saved = count
+            except OSError as e:
+                print(f"Failed to save embedding cache: {e}")
+
+    def _append_embeddings(self, keys, new_rows):
+        """Add rows for keys not cached yet; the caller holds _emb_lock"""
+        fresh = [i for i, key in enumerate(keys) if key not in self._emb_rows]  # Another solve may have added some
+        if not fresh:
+            return
+        start = len(self._emb_rows)
+        end = start + len(fresh)
+        matrix = self._emb_matrix
+        if matrix is None or end > len(matrix) or not matrix.flags.writeable:
+            # Grow geometrically (and off the read-only memory map) so appends stay amortized O(1)
+            grown = np.empty((max(end, 2 * start), new_rows.shape[1]), dtype=np.float32)
+            if start:
+                grown[:start] = matrix[:start]
+            self._emb_matrix = matrix = grown
+        matrix[start:end] = new_rows[fresh]
+        for row, i in enumerate(fresh, start):
+            self._emb_rows[keys[i]] = row
+
+    def _encode_definitions(self, definitions):
+        """Embed definitions, running the model only on those missing from the disk cache"""
+        keys = [hashlib.sha1(d.encode('utf-8')).hexdigest() for d in definitions]
+        missing = {}
+        with self._emb_lock:
+            for key, definition in zip(keys, definitions):
+                if key not in self._emb_rows:
+                    missing.setdefault(key, definition)
+        if missing:
+            # Encode outside the lock; concurrent solves may encode the same text, the first append wins
+            new_rows = self.similarity_model.encode(list(missing.values()), convert_to_numpy=True,
+                                                    batch_size=1024, show_progress_bar=False)
+            new_rows = np.asarray(new_rows, dtype=np.float32)  # Cache stays FP32 across devices
+            with self._emb_lock:
+                self._append_embeddings(list(missing), new_rows)
+                # Save once the unsaved rows match those on disk, so rewrites are amortized
+                flush = len(self._emb_rows) - self._emb_saved >= max(EMBEDDING_FLUSH_ROWS, self._emb_saved)
+            if flush:
+                self._save_embedding_cache()
+        with self._emb_lock:
+            rows = [self._emb_rows[key] for key in keys]
+            selected = self._emb_matrix[rows]  # Fancy indexing copies, so later growth cannot alias it
+        return torch.from_numpy(selected)
+
     def load_word_database(self, file_path):
         script_dir = os.path.dirname(os.path.abspath(__file__))
         absolute_path = os.path.join(script_dir, file_path)
@@ -80,45 +322,167 @@ class CrosswordSolver:
     def load_feedback_database(self, file_path):
         script_dir = os.path.dirname(os.path.abspath(__file__))
         absolute_path = os.path.join(script_dir, file_path)
+        feedback = {}
         try:
             with open(absolute_path, 'r') as f:
-                return json.load(f)  # JSON loads keys as strings
+                snapshot = json.load(f)  # JSON loads keys as strings
+            if isinstance(snapshot, dict):
+                feedback = snapshot
         except (FileNotFoundError, json.JSONDecodeError):
-            return {}
+            pass
+        # Replay the append-only log; later entries win
+        try:
+            with open(os.path.join(script_dir, self.feedback_log), 'r') as f:
+                for line in f:
+                    try:
+                        entry = json.loads(line)
+                    except json.JSONDecodeError:
+                        continue  # Partial line from an interrupted write
+                    if isinstance(entry, dict):  # One {key: word} object per line
+                        feedback.update((k, w) for k, w in entry.items() if isinstance(w, str))
+        except FileNotFoundError:
+            pass
+        return feedback
 
     def save_feedback(self, clue, pattern, correct_word):
         key = str((clue, pattern.upper()))
         self.feedback_db[key] = correct_word.upper()
+        self._compute.cache_clear()
         script_dir = os.path.dirname(os.path.abspath(__file__))
-        absolute_path = os.path.join(script_dir, "feedback.json")
-        with open(absolute_path, 'w') as f:
-            json.dump(self.feedback_db, f, indent=4)
+        absolute_path = os.path.join(script_dir, self.feedback_log)
+        line = json.dumps({key: correct_word.upper()}) + "\n"
+        with open(absolute_path, 'a+b') as f:
+            if f.seek(0, os.SEEK_END):
+                f.seek(-1, os.SEEK_END)
+                if f.read(1) != b"\n":
+                    line = "\n" + line  # Close a partial line left by an interrupted write
+            f.write(line.encode('utf-8'))
+
+    def _get_synsets(self, word):
+        """Return WordNet synsets for a word, querying the corpus only once"""
+        word = word.lower()
+        if word not in self._synset_cache:
+            self._synset_cache[word] = wordnet.synsets(word)
+        return self._synset_cache[word]
+
+    def _word_bag(self, word):
+        """Cached (definition tokens, name counts, hypernym counts, definition) for a word"""
+        if word not in self._word_bags:
+            synsets = self._get_synsets(word)
+            if not synsets:
+                self._word_bags[word] = None
+                return None
+            best_def = synsets[0].definition()
+            def_tokens = _token_set(best_def)
+            # Counts keep the per-synset weighting: a token shared by two synsets scores twice
+            name_counts = defaultdict(int)
+            hyper_counts = defaultdict(int)
+            for syn in synsets:
+                for token in _name_tokens(syn.name()):
+                    name_counts[token] += 1
+                for hyper in syn.hypernyms():
+                    for token in _name_tokens(hyper.name()):
+                        hyper_counts[token] += 1
+            self._word_bags[word] = (def_tokens, dict(name_counts), dict(hyper_counts), best_def)
+        return self._word_bags[word]
 
     def pattern_to_regex(self, pattern):
         """Convert pattern to regex with strict length enforcement"""
-        if not pattern or pattern.strip() == "":
-            return r"^[A-Z]{2,15}$"  # Default range for word length if no pattern
-        # Calculate exact length from pattern
-        length = len(pattern)
-        regex = "".join("[A-Z]" if not c.isalpha() else c.upper() for c in pattern)
-        return f"^{regex}$"  # Enforce exact length with ^ and $
+        return _pattern_regex(pattern)
 
     def find_matches(self, pattern, clue):
         """Find matches with exact length enforcement based on pattern"""
         try:
-            regex = self.pattern_to_regex(pattern)
-            matches = [word for word in self.word_list if re.match(regex, word)]
+            if not pattern or pattern.strip() == "":
+                matches = self.blank_matches
+            elif pattern.isalpha():
+                # Fully specified pattern: a single membership test
+                word = pattern.upper()
+                return [word] if word in self.word_set else []
+            else:
+                matches = self._match_template(pattern)
             if not pattern or all(c == '?' for c in pattern):
                 # If pattern is vague, estimate length from clue
-                clue_tokens = word_tokenize(clue.lower())
+                clue_tokens = _TOKEN_RE.findall(clue.lower())
                 est_len = max(2, min(15, int(len(clue_tokens) * 1.5)))
                 matches = [w for w in matches if abs(len(w) - est_len) <= 3]
-            # If pattern is provided, length is already enforced by regex
+            # If pattern is provided, length is already enforced by the bucket
             return matches
         except Exception as e:
             print(f"Pattern error: {e}")
             return self.word_list[:100]  # Fallback for semantic ranking
 
+    def _match_template(self, pattern):
+        """Match a pattern with fixed letters against words of the same length"""
+        letters = [c.upper() if c.isalpha() else None for c in pattern]
+        if not any(letters):
+            return list(self.words_by_len.get(len(pattern), []))
+        if self.buckets_np:
+            return self._match_bitsets(letters)
+        return self._walk_trie(letters)
+
+    def _match_bitsets(self, letters):
+        """AND the packed (position, letter) bitmaps of the length bucket"""
+        length = len(letters)
+        bucket = self.words_by_len.get(length, [])
+        if not bucket:
+            return []
+        bitsets = self._bitsets_for(length)
+        bits = None
+        for i, letter in enumerate(letters):
+            if letter is None:
+                continue
+            if (i, letter) not in bitsets:
+                return []
+            bits = bitsets[(i, letter)] if bits is None else bits & bitsets[(i, letter)]
+        hits = np.flatnonzero(np.unpackbits(bits, count=len(bucket)))
+        return [bucket[i] for i in hits]
+
+    def _bitsets_for(self, length):
+        """Build packed bitmaps of which words have each letter at each position, on first use"""
+        if length not in self.bitsets:
+            arr = self.buckets_np[length]
+            view = arr.view('S1').reshape(len(arr), length)
+            bitsets = {}
+            for i in range(length):
+                column = view[:, i]
+                for letter in np.unique(column):
+                    bitsets[(i, letter.decode())] = np.packbits(column == letter)
+            self.bitsets[length] = bitsets
+        return self.bitsets[length]
+
+    def _walk_trie(self, letters):
+        """Walk the trie for the pattern's length, descending only into allowed branches"""
+        hits = []
+
+        def walk(node, depth):
+            if depth == len(letters):
+                hits.extend(node[_WORD_END])
+                return
+            letter = letters[depth]
+            if letter is None:
+                for child in node.values():
+                    walk(child, depth + 1)
+            elif letter in node:
+                walk(node[letter], depth + 1)
+
+        walk(self._trie_for(len(letters)), 0)
+        # Back to bucket (dictionary) order, as the bitset path returns them
+        bucket = self.words_by_len.get(len(letters), [])
+        return [bucket[i] for i in sorted(hits)]
+
+    def _trie_for(self, length):
+        """Build the nested-dict trie for one word length on first use"""
+        if length not in self.tries:
+            root = {}
+            for i, word in enumerate(self.words_by_len.get(length, [])):
+                node = root
+                for c in word:
+                    node = node.setdefault(c, {})
+                node.setdefault(_WORD_END, []).append(i)  # Bucket indices; duplicates keep each copy
+            self.tries[length] = root
+        return self.tries[length]
+
     def rank_by_clue(self, clue, matches, pattern):
         """Rank matches prioritizing clue's semantic essence"""
         if not clue:
@@ -127,7 +491,7 @@ class CrosswordSolver:
         key = str((clue, pattern.upper()))
         if key in self.feedback_db and self.feedback_db[key] in matches:
             correct_word = self.feedback_db[key]
-            synsets = wordnet.synsets(correct_word.lower())
+            synsets = self._get_synsets(correct_word)
             definition = synsets[0].definition() if synsets else "User-corrected"
             return [(correct_word, 1.0, definition)]
 
@@ -136,52 +500,71 @@ class CrosswordSolver:
         return self._wordnet_ranking(clue, matches)
 
     def _ai_ranking(self, clue, matches):
-        """Semantic ranking with AI embeddings"""
+        """Semantic ranking with AI embeddings, scoring all definitions in one matmul"""
         clue_embedding = self.similarity_model.encode(clue, convert_to_tensor=True)
-        ranked = []
+        clue_len = len(_CLUE_TOKENIZER.tokenize(clue))
+        # Flatten every candidate's definitions, remembering where each word's run starts
+        candidates, all_defs, starts = [], [], []
         for word in matches:
             if word in self.excluded_words:
                 continue
-            synsets = wordnet.synsets(word.lower())
+            synsets = self._get_synsets(word)
             definitions = [syn.definition() for syn in synsets] if synsets else [word]
-            def_embeddings = self.similarity_model.encode(definitions, convert_to_tensor=True)
-            similarities = util.pytorch_cos_sim(clue_embedding, def_embeddings)[0]
-            max_sim = similarities.max().item()
-            best_def = definitions[similarities.argmax()] if similarities.size else "No definition"
-            clue_len = len(word_tokenize(clue))
-            length_boost = min(0.1, 0.03 * abs(len(word) - clue_len))
-            ranked.append((word, max_sim + length_boost, best_def))
-        return sorted(ranked, key=lambda x: x[1], reverse=True)[:3]
+            candidates.append(word)
+            starts.append(len(all_defs))
+            all_defs.extend(definitions)
+        if not all_defs:
+            return []
+        def_embeddings = self._encode_definitions(all_defs).to(clue_embedding)
+        clue_norm = torch.nn.functional.normalize(clue_embedding.unsqueeze(0), dim=1)
+        def_norm = torch.nn.functional.normalize(def_embeddings, dim=1)
+        sims = (clue_norm @ def_norm.T)[0].cpu().numpy()
+
+        starts = np.array(starts)
+        lengths = np.diff(np.append(starts, len(all_defs)))
+        word_max = np.maximum.reduceat(sims, starts)
+        # First definition reaching each word's maximum is its best definition
+        owner = np.repeat(np.arange(len(candidates)), lengths)
+        hits = np.flatnonzero(sims == word_max[owner])
+        best_def = hits[np.unique(owner[hits], return_index=True)[1]]
+        word_lens = np.array([len(w) for w in candidates])
+        scores = word_max + np.minimum(0.1, 0.03 * np.abs(word_lens - clue_len))
+
+        # O(n): keep everything tied with the 3rd best score, then order by (score desc, candidate order)
+        top = np.arange(len(scores))
+        if len(scores) > 3:
+            top = np.flatnonzero(scores >= np.partition(scores, -3)[-3])
+        top = top[np.lexsort((top, -scores[top]))][:3]
+        return [(candidates[i], float(scores[i]), all_defs[best_def[i]]) for i in top]
 
     def _wordnet_ranking(self, clue, matches):
         """Enhanced WordNet ranking with lemmatization and hypernyms"""
-        clue_words = set(self.lemmatizer.lemmatize(w.lower()) for w in word_tokenize(clue.lower()))
+        clue_words = _token_set(clue)
         ranked = []
         for word in matches:
-            synsets = wordnet.synsets(word.lower())
-            if not synsets:
+            bag = self._word_bag(word)
+            if bag is None:
                 ranked.append((word, 0, "No definition"))
                 continue
-            score = 0
-            best_def = synsets[0].definition()
-            def_words = set(self.lemmatizer.lemmatize(w.lower()) for w in word_tokenize(best_def))
-            
-            score += len(clue_words.intersection(def_words)) * 0.5
-            for syn in synsets:
-                syn_name = set(self.lemmatizer.lemmatize(w.lower()) for w in syn.name().split('.'))
-                score += len(clue_words.intersection(syn_name)) * 0.7
-                for hyper in syn.hypernyms():
-                    hyper_name = set(self.lemmatizer.lemmatize(w.lower()) for w in hyper.name().split('.'))
-                    score += len(clue_words.intersection(hyper_name)) * 0.3
-            
+            def_words, name_counts, hyper_counts, best_def = bag
+            # Weights 0.5 / 0.7 / 0.3 applied in integers so equal scores compare equal
+            score = (len(clue_words & def_words) * 5
+                     + sum(name_counts.get(w, 0) for w in clue_words) * 7
+                     + sum(hyper_counts.get(w, 0) for w in clue_words) * 3) / 10
             ranked.append((word, score, best_def))
-        return sorted(ranked, key=lambda x: x[1], reverse=True)[:3]
+        return heapq.nlargest(3, ranked, key=lambda x: x[1])
+
+    def _compute_uncached(self, clue, pattern, excluded, ai_ready):
+        """Match and rank a query; `excluded` and `ai_ready` only key the cache"""
+        matches = self.find_matches(pattern, clue)
+        return tuple(self.rank_by_clue(clue, matches, pattern))
 
     def solve(self, clue, pattern):
         """Main method to solve crossword clues"""
-        matches = self.find_matches(pattern, clue)
-        ranked = self.rank_by_clue(clue, matches, pattern)
-        self.current_results = {(clue, pattern.upper()): ranked}
+        # Keyed on the ranker too, so a WordNet result stored while the model was loading is not reused
+        ranked = self._compute(clue, pattern, frozenset(self.excluded_words),
+                               self.similarity_model is not None)
+        self.current_results = {(clue, pattern.upper()): list(ranked)}
         return self.current_results
 
 class ModernCrosswordApp:
@@ -245,6 +628,9 @@ class ModernCrosswordApp:
         self._create_widgets()
         self.widgets_created = True
         self._bind_events()
+        self.solver.on_models_ready = lambda: self.root.after(0, self._on_models_ready)
+        if self.solver.models_ready.is_set():
+            self._on_models_ready()
 
 
     def _setup_styles(self):
@@ -440,6 +826,10 @@ class ModernCrosswordApp:
         self.subtitle_label.configure(foreground=theme['subtitle_foreground'], 
                                      background=theme['header_background'])
 
+    def _on_models_ready(self):
+        if self.solver.similarity_model:
+            self.status_var.set("AI ranker ready")
+
     def _bind_events(self):
         self.root.bind("<Return>", lambda e: self._solve())
         self.root.bind("<Escape>", lambda e: self.root.quit())
@@ -447,7 +837,7 @@ class ModernCrosswordApp:
     def _solve(self):
         clue = self.clue_entry.get().strip()
         pattern = self.pattern_entry.get().strip()
-        self.solver.excluded_words = []
+        self.solver.excluded_words = set()
         
         if not clue:
             messagebox.showerror("Error", "Please enter a clue")
@@ -1,80 +1,376 @@
 import os
 import re
+import sys
 import json
+import pickle
+import functools
+import heapq
+from array import array
+from itertools import accumulate
 import tkinter as tk
 from tkinter import ttk, messagebox, simpledialog
-from threading import Thread
+from threading import Event, Lock, Thread
+from concurrent.futures import ThreadPoolExecutor
+from operator import itemgetter
 import webbrowser
 
-import nltk
-from nltk.corpus import wordnet
-from nltk.tokenize import word_tokenize
-from nltk.stem import WordNetLemmatizer
+try:
+    import orjson  # Faster feedback (de)serialization when available
+except ImportError:
+    orjson = None
+
+# NLTK is imported on first use (see _ensure_nltk) so the module loads quickly
+nltk = None
+wordnet = None
+WordNetLemmatizer = None
+_NLTK_LOCK = Lock()
+
+
+def _ensure_nltk():
+    """Import NLTK and make sure WordNet data is present; a no-op after the first call."""
+    global nltk, wordnet, WordNetLemmatizer
+    if wordnet is not None:
+        return  # Fast path: already imported, no lock needed
+    with _NLTK_LOCK:
+        if wordnet is not None:
+            return
+        import nltk as _nltk
+        from nltk.corpus import wordnet as _wordnet
+        from nltk.stem import WordNetLemmatizer as _lemmatizer_cls
+        # Only go to the network when the corpus is missing
+        try:
+            _nltk.data.find('corpora/wordnet')
+        except LookupError:
+            _nltk.download('wordnet', quiet=True)
+        nltk, wordnet, WordNetLemmatizer = _nltk, _wordnet, _lemmatizer_cls
+
+
+# Letter-run tokenizer for clues and definitions (only fed into lemma sets and counts)
+_TOKEN_RE = re.compile(r"[A-Za-z]+")
+# A whole letter-only line of the word blob
+_LETTER_LINE_RE = re.compile(rb"^[A-Za-z]+$", re.MULTILINE)
+
+
+def _json_loads(data):
+    return orjson.loads(data) if orjson is not None else json.loads(data)
+
+
+def _json_dumps(obj) -> bytes:
+    return orjson.dumps(obj) if orjson is not None else json.dumps(obj).encode()
+
 
-# Ensure necessary NLTK data is present
-nltk.download('wordnet', quiet=True)
-nltk.download('punkt', quiet=True)
+# Bump when the layout of CrosswordSolver.word_features changes, to invalidate old caches
+_FEATURES_VERSION = 4
+
+# Scoring is pure Python over precomputed features, so threads only help when the
+# interpreter runs without the GIL (free-threaded 3.13+ builds)
+_PARALLEL_RANKING = not getattr(sys, "_is_gil_enabled", lambda: True)()
+_RANK_WORKERS = os.cpu_count() or 1
+_RANK_POOL = ThreadPoolExecutor(max_workers=_RANK_WORKERS) if _PARALLEL_RANKING else None
+
+
+def _score_matches(words, clue_words, word_features) -> list:
+    """Score candidate words against clue lemmas using only precomputed features."""
+    ranked = []
+    for w in words:
+        feats = word_features.get(w)
+        if feats is None:
+            ranked.append((w, 0.0, "No definition"))
+            continue
+
+        base_def, def_words, name_counts, hyper_counts = feats
+        name_hits = sum(name_counts.get(t, 0) for t in clue_words)
+        hyper_hits = sum(hyper_counts.get(t, 0) for t in clue_words)
+        # Weights 0.5 / 0.7 / 0.3 applied in integers so equal scores compare equal
+        score = (len(clue_words & def_words) * 5 + name_hits * 7 + hyper_hits * 3) / 10
+
+        ranked.append((w, score, base_def))
+    return ranked
 
 
 class CrosswordSolver:
     """Core crossword solving engine with enhanced clue-based ranking"""
 
     def __init__(self, word_file="words.txt", feedback_file="feedback.json"):
-        self.word_list = self._load_word_db(word_file)
-        if not self.word_list:
+        # One newline-terminated blob plus start offsets instead of a list of str objects
+        self._word_blob, self._word_offsets = self._load_word_db(word_file)
+        self.word_count = len(self._word_offsets) - 1
+        if not self.word_count:
             raise FileNotFoundError(f"Word list {word_file} not loaded. Exiting.")
+        self._words_by_len = self._build_length_buckets()
+        # (length, position, letter) -> word numbers within _words_by_len[length], built per length on demand
+        self._posn_index = {}
+        self._indexed_lengths = set()
+        # Corrections are appended to a log next to the (legacy) JSON snapshot, as in ClueCortex.py
+        self.feedback_log = os.path.splitext(feedback_file)[0] + ".log"
         self.feedback_db = self._load_feedback_db(feedback_file)
+        # Feedback keys whose word is known to fit the key's pattern
+        self._feedback_valid = set()
         self.excluded_words = []
         self.current_results = None
-        self.lemmatizer = WordNetLemmatizer()
+        # NLTK is imported and warmed up by the background thread below; ranking waits on nltk_ready
+        self.lemmatizer = None
+        self.nltk_ready = Event()
+        # Clue and definition vocabularies repeat heavily, so memoize the morphy lookup
+        self._lem = functools.lru_cache(maxsize=200_000)(self._lemmatize)
+        # Wrapped per instance; lru_cache on the methods themselves would pin self
+        self.pattern_to_regex = functools.lru_cache(maxsize=1024)(self._pattern_to_regex)
+        self._compiled_pattern = functools.lru_cache(maxsize=1024)(self._compile_pattern)
+        # WordNet lookups are cached for the session: word -> synsets, and
+        # synset name -> (name tokens, one token set per hypernym)
+        self._syn_cache = {}
+        self._syn_meta = {}
+        # Ranking features for every letter-only word with synsets are filled in by a background
+        # thread; words a query needs before features_ready is set are computed on demand, and
+        # _looked_up remembers those without synsets until then (absence is enough afterwards)
+        self.word_features = {}
+        self._looked_up = set()
+        self._wordnet_lock = Lock()  # NLTK's WordNet reader shares file handles between threads
+        self.features_ready = Event()
+        Thread(target=self._load_nltk_and_features, args=(word_file,), daemon=True).start()
 
     def _load_word_db(self, file_path):
+        """Return (UTF-8 blob of newline-terminated words, int32 start offsets incl. the end)."""
         script_dir = os.path.dirname(os.path.abspath(__file__))
         path = os.path.join(script_dir, file_path)
         try:
             with open(path, 'r') as f:
-                return [line.strip().upper() for line in f if line.strip()]
+                # Deduplicated (keeping file order) so each candidate appears in matches once
+                words = list(dict.fromkeys(line.strip().upper() for line in f if line.strip()))
         except FileNotFoundError:
             print(f"Error: {path} not found.")
-            return []
+            words = []
+        encoded = [w.encode('utf-8') for w in words]
+        offsets = array('i', accumulate((len(b) + 1 for b in encoded), initial=0))
+        return b"".join(b + b"\n" for b in encoded), offsets
+
+    def word(self, i: int) -> str:
+        """The i-th word of the word list."""
+        off = self._word_offsets
+        return self._word_blob[off[i]:off[i + 1] - 1].decode('utf-8')
+
+    def _build_length_buckets(self) -> dict:
+        """Concatenate letter-only words of each length into one fixed-width bytes blob, in dictionary order."""
+        buckets = {}
+        for m in _LETTER_LINE_RE.finditer(self._word_blob):
+            b = m.group()
+            buckets.setdefault(len(b), []).append(b)
+        return {length: b"".join(words) for length, words in buckets.items()}
+
+    def _bucket_words(self, length: int, numbers) -> list:
+        blob = self._words_by_len.get(length, b"")
+        return [blob[n * length:(n + 1) * length].decode('ascii') for n in numbers]
+
+    def _index_length(self, length: int):
+        if length in self._indexed_lengths:
+            return
+        blob = self._words_by_len.get(length, b"")
+        for n in range(len(blob) // length):
+            for p, c in enumerate(blob[n * length:(n + 1) * length].decode('ascii')):
+                self._posn_index.setdefault((length, p, c), set()).add(n)
+        self._indexed_lengths.add(length)
 
     def _load_feedback_db(self, file_path):
         script_dir = os.path.dirname(os.path.abspath(__file__))
-        path = os.path.join(script_dir, file_path)
+        feedback = {}
         try:
-            with open(path, 'r') as f:
-                return json.load(f)
-        except (FileNotFoundError, json.JSONDecodeError):
-            return {}
+            with open(os.path.join(script_dir, file_path), 'rb') as f:
+                feedback = _json_loads(f.read())
+        except (FileNotFoundError, ValueError):
+            pass
+        # Replay appended entries over the snapshot; later lines win
+        try:
+            with open(os.path.join(script_dir, self.feedback_log), 'rb') as f:
+                for line in f:
+                    try:
+                        entry = _json_loads(line)
+                    except ValueError:
+                        continue  # Partial line from an interrupted write
+                    if isinstance(entry, dict):  # One {key: word} object per line
+                        feedback.update((k, w) for k, w in entry.items() if isinstance(w, str))
+        except FileNotFoundError:
+            pass
+        return feedback
 
     def save_feedback(self, clue, pattern, correct_word):
         key = str((clue, pattern.upper()))
         self.feedback_db[key] = correct_word.upper()
-        path = os.path.join(os.path.dirname(__file__), "feedback.json")
-        with open(path, 'w') as f:
-            json.dump(self.feedback_db, f, indent=4)
-
-    def pattern_to_regex(self, pattern: str) -> str:
+        if self._compiled_pattern(pattern).match(self.feedback_db[key]):
+            self._feedback_valid.add(key)
+        else:
+            self._feedback_valid.discard(key)
+        path = os.path.join(os.path.dirname(os.path.abspath(__file__)), self.feedback_log)
+        line = _json_dumps({key: self.feedback_db[key]}) + b"\n"
+        with open(path, 'a+b') as f:
+            if f.seek(0, os.SEEK_END):
+                f.seek(-1, os.SEEK_END)
+                if f.read(1) != b"\n":
+                    line = b"\n" + line  # Close a partial line left by an interrupted write
+            f.write(line)
+
+    def _synsets_for(self, word: str) -> list:
+        """Return synsets for a word, querying WordNet only once."""
+        word = word.lower()
+        if word not in self._syn_cache:
+            with self._wordnet_lock:
+                self._syn_cache[word] = wordnet.synsets(word)
+        return self._syn_cache[word]
+
+    def _synset_meta(self, s) -> tuple:
+        """Lemmatized name tokens and one token set per hypernym, cached by synset name."""
+        if s.name() not in self._syn_meta:
+            name_words = frozenset(
+                sys.intern(self._lem(x.lower()))
+                for x in s.name().split('.')
+            )
+            hyper_words = tuple(
+                frozenset(sys.intern(self._lem(x.lower())) for x in h.name().split('.'))
+                for h in s.hypernyms()
+            )
+            self._syn_meta[s.name()] = (name_words, hyper_words)
+        return self._syn_meta[s.name()]
+
+    def _load_nltk_and_features(self, word_file: str):
+        try:
+            _ensure_nltk()
+            lemmatizer = WordNetLemmatizer()
+            # Force WordNet and the lemmatizer's morphy data to load now, in this thread,
+            # instead of stalling (or racing) on first access during ranking
+            wordnet.ensure_loaded()
+            lemmatizer.lemmatize('test')
+            self.lemmatizer = lemmatizer
+        finally:
+            self.nltk_ready.set()  # Also on failure, so rank_by_clue reports it instead of hanging
+        self._load_word_features(word_file)
+        self.features_ready.set()
+        self._looked_up.clear()
+
+    def _lemmatize(self, word: str) -> str:
+        return self.lemmatizer.lemmatize(word)
+
+    def _load_word_features(self, word_file: str):
+        """Fill word_features from the on-disk cache, rebuilding it if the inputs changed."""
+        script_dir = os.path.dirname(os.path.abspath(__file__))
+        cache_path = os.path.join(script_dir, "features.cache.pkl")
+        header = (_FEATURES_VERSION, word_file,
+                  os.path.getmtime(os.path.join(script_dir, word_file)), nltk.__version__)
+        try:
+            with open(cache_path, 'rb') as f:
+                if pickle.load(f) == header:
+                    cached = pickle.load(f)
+                    if isinstance(cached, dict):
+                        self.word_features.update(cached)
+                        return
+        except Exception:
+            pass  # Missing, truncated, corrupt or from another version: rebuild below
+        self._build_word_features()
+        with self._wordnet_lock:
+            features = dict(self.word_features)  # Snapshot; queries may still add entries
+        try:
+            # Written aside and swapped in, so readers never see a partial file
+            tmp_path = f"{cache_path}.{os.getpid()}.tmp"
+            with open(tmp_path, 'wb') as f:
+                pickle.dump(header, f, pickle.HIGHEST_PROTOCOL)
+                pickle.dump(features, f, pickle.HIGHEST_PROTOCOL)
+            os.replace(tmp_path, cache_path)
+        except OSError as e:
+            print(f"Could not write feature cache: {e}")
+
+    def _build_word_features(self):
+        """Compute features for every letter-only word, the only words the matchers return."""
+        for length, blob in self._words_by_len.items():
+            words = self._bucket_words(length, range(len(blob) // length))
+            # Small batches so queries computing their own features are not held up for long
+            for i in range(0, len(words), 256):
+                self._add_features(words[i:i + 256], remember_misses=False)
+
+    def _ensure_features(self, words):
+        """Compute features a query needs before the background build is done."""
+        if not self.features_ready.is_set():
+            self._add_features(words, remember_misses=True)
+
+    def _add_features(self, words, remember_misses: bool):
+        """Store features for words not looked up yet; only words with synsets get an entry."""
+        features, looked_up = self.word_features, self._looked_up
+        missing = [w for w in words if w not in features and w not in looked_up]
+        if missing:
+            with self._wordnet_lock:
+                for w in missing:
+                    if w in features or w in looked_up:
+                        continue
+                    feats = self._word_feature(w)
+                    if feats is not None:
+                        features[w] = feats
+                    elif remember_misses:
+                        looked_up.add(w)
+
+    def _word_feature(self, w: str):
+        """(definition, def tokens, name counts, hypernym counts) for a word, or None without synsets."""
+        syns = wordnet.synsets(w.lower())
+        if not syns:
+            return None
+        base_def = syns[0].definition()
+        # Interned so every feature shares one string object per distinct token
+        def_words = frozenset(
+            sys.intern(self._lem(m.group(0)))
+            for m in _TOKEN_RE.finditer(base_def.lower())
+        )
+        # Counts = how many synset/hypernym names contain a token, which keeps
+        # the per-synset accumulation of the original scoring loop
+        name_counts, hyper_counts = {}, {}
+        for s in syns:
+            name_words, hyper_sets = self._synset_meta(s)
+            for t in name_words:
+                name_counts[t] = name_counts.get(t, 0) + 1
+            for hyper_words in hyper_sets:
+                for t in hyper_words:
+                    hyper_counts[t] = hyper_counts.get(t, 0) + 1
+        return base_def, def_words, name_counts, hyper_counts
+
+    def _pattern_to_regex(self, pattern: str) -> str:
         if not pattern or pattern.strip() == "":
             return r"^[A-Z]{2,15}$"
         regex = "".join("[A-Z]" if not c.isalpha() else c.upper() for c in pattern)
         return f"^{regex}$"
 
-    def find_matches(self, pattern: str, clue: str) -> list:
+    def _compile_pattern(self, pattern: str):
+        return re.compile(self.pattern_to_regex(pattern))
+
+    def find_matches(self, pattern: str, clue: str, regex=None) -> list:
         try:
-            regex = self.pattern_to_regex(pattern)
-            matches = [w for w in self.word_list if re.match(regex, w)]
+            if pattern and pattern.strip():
+                matches = self._match_indexed(pattern)
+            else:
+                regex = regex or self._compiled_pattern(pattern)
+                # One multiline scan over the blob; each line is exactly one word
+                scan = re.compile(regex.pattern.encode(), re.MULTILINE)
+                matches = [m.group().decode('ascii') for m in scan.finditer(self._word_blob)]
             if not pattern or all(c == '?' for c in pattern):
-                tokens = word_tokenize(clue.lower())
+                tokens = _TOKEN_RE.findall(clue.lower())
                 est_len = max(2, min(15, int(len(tokens) * 1.5)))
                 matches = [w for w in matches if abs(len(w) - est_len) <= 3]
             return matches
         except Exception as e:
             print(f"Pattern error: {e}")
-            return self.word_list[:100]
-
-    def rank_by_clue(self, clue: str, matches: list, pattern: str) -> list:
+            return [self.word(i) for i in range(min(100, self.word_count))]
+
+    def _match_indexed(self, pattern: str) -> list:
+        """Intersect the position-index sets of the pattern's fixed letters, smallest first."""
+        length = len(pattern)
+        fixed = [(length, p, c.upper()) for p, c in enumerate(pattern) if c.isalpha()]
+        if not fixed:
+            return self._bucket_words(length, range(len(self._words_by_len.get(length, b"")) // length))
+        self._index_length(length)
+        sets = sorted((self._posn_index.get(key, set()) for key in fixed), key=len)
+        hits = functools.reduce(set.intersection, sets)
+        return self._bucket_words(length, sorted(hits))
+
+    def rank_by_clue(self, clue: str, matches: list, pattern: str, regex=None) -> list:
         """Rank matches by clue, prioritizing user feedback with definitions."""
+        if not self.nltk_ready.is_set():
+            self.nltk_ready.wait()
+        if self.lemmatizer is None:
+            raise RuntimeError("NLTK WordNet could not be loaded; see the console for details.")
         if not clue:
             return [(m, 0.0, "No clue provided") for m in matches[:3]]
 
@@ -82,15 +378,24 @@ class CrosswordSolver:
         ranked = []
 
         # Check for feedback and include it if it matches the pattern
-        if key in self.feedback_db:
-            correct = self.feedback_db[key]
-            if re.match(self.pattern_to_regex(pattern), correct):
-                syns = wordnet.synsets(correct.lower())
+        correct = self.feedback_db.get(key)
+        if correct is not None:
+            # The pattern is part of the key, so a word only needs validating once
+            if key not in self._feedback_valid and (regex or self._compiled_pattern(pattern)).match(correct):
+                self._feedback_valid.add(key)
+            if key in self._feedback_valid:
+                syns = self._synsets_for(correct)
                 definition = syns[0].definition() if syns else "User-provided"
                 ranked.append((correct, 1.0, definition))
 
         # Get additional ranked matches, excluding the feedback word
-        other_matches = [m for m in matches if m != correct] if 'correct' in locals() else matches
+        other_matches = matches
+        if correct is not None:
+            other_matches = list(matches)
+            try:
+                other_matches.remove(correct)
+            except ValueError:
+                pass  # Feedback word is not among this pattern's matches
         other_ranked = self._wordnet_ranking(clue, other_matches)[:2]
         ranked.extend(other_ranked)
 
@@ -101,44 +406,36 @@ class CrosswordSolver:
         return ranked
 
     def _wordnet_ranking(self, clue: str, matches: list) -> list:
-        clue_words = {
-            self.lemmatizer.lemmatize(w.lower())
-            for w in word_tokenize(clue.lower())
-        }
-        ranked = []
-        for w in matches:
-            syns = wordnet.synsets(w.lower())
-            if not syns:
-                ranked.append((w, 0.0, "No definition"))
-                continue
-
-            base_def = syns[0].definition()
-            def_words = {
-                self.lemmatizer.lemmatize(x.lower())
-                for x in word_tokenize(base_def)
-            }
-            score = len(clue_words & def_words) * 0.5
-
-            for s in syns:
-                name_words = {
-                    self.lemmatizer.lemmatize(x.lower())
-                    for x in s.name().split('.')
-                }
-                score += len(clue_words & name_words) * 0.7
-                for h in s.hypernyms():
-                    hyper_words = {
-                        self.lemmatizer.lemmatize(x.lower())
-                        for x in h.name().split('.')
-                    }
-                    score += len(clue_words & hyper_words) * 0.3
-
-            ranked.append((w, score, base_def))
-
-        return sorted(ranked, key=lambda x: x[1], reverse=True)[:3]
+        if not matches:
+            return []
+        # Single pass over the lowered clue; a frozenset to match the feature token sets
+        clue_words = frozenset(
+            sys.intern(self._lem(m.group(0)))
+            for m in _TOKEN_RE.finditer(clue.lower())
+        )
+        if not clue_words:
+            # Every score would be 0.0, which keeps match order, so skip scoring
+            self._ensure_features(matches[:3])
+            feats = self.word_features
+            return [(w, 0.0, feats[w][0] if feats.get(w) else "No definition") for w in matches[:3]]
+        self._ensure_features(matches)
+        if _RANK_POOL is not None and len(matches) > 32:
+            # One contiguous chunk per worker; features are read-only, so no locking
+            size = -(-len(matches) // _RANK_WORKERS)
+            chunks = [matches[i:i + size] for i in range(0, len(matches), size)]
+            ranked = []
+            for part in _RANK_POOL.map(_score_matches, chunks,
+                                       [clue_words] * len(chunks), [self.word_features] * len(chunks)):
+                ranked.extend(part)
+        else:
+            ranked = _score_matches(matches, clue_words, self.word_features)
+
+        return heapq.nlargest(3, ranked, key=itemgetter(1))
 
     def solve(self, clue: str, pattern: str) -> dict:
-        matches = self.find_matches(pattern, clue)
-        ranked = self.rank_by_clue(clue, matches, pattern)
+        regex = self._compiled_pattern(pattern)  # Compiled once, shared by both steps
+        matches = self.find_matches(pattern, clue, regex)
+        ranked = self.rank_by_clue(clue, matches, pattern, regex)
         self.current_results = {(clue, pattern.upper()): ranked}
         return self.current_results
 
@@ -207,40 +504,42 @@ class ModernCrosswordApp:
         style = ttk.Style()
         style.theme_use("clam")
         t = self.themes[self.current_theme]
+        mbg, tbg, tfg, prim, sec, acc, hbg, hfg = (
+            t['main_background'], t['text_background'], t['text_foreground'], t['primary'],
+            t['secondary'], t['accent'], t['header_background'], t['header_foreground'])
 
-        style.configure("TFrame", background=t['main_background'])
-        style.configure("Card.TFrame", background=t['text_background'], relief="flat", borderwidth=1)
-        style.configure("Header.TFrame", background=t['header_background'], relief="flat", borderwidth=0)
+        style.configure("TFrame", background=mbg)
+        style.configure("Card.TFrame", background=tbg, relief="flat", borderwidth=1)
+        style.configure("Header.TFrame", background=hbg, relief="flat", borderwidth=0)
 
-        style.configure("TLabel", background=t['main_background'], foreground=t['text_foreground'], font=self.text_font)
-        style.configure("Header.TLabel", background=t['header_background'], foreground=t['header_foreground'])
+        style.configure("TLabel", background=mbg, foreground=tfg, font=self.text_font)
+        style.configure("Header.TLabel", background=hbg, foreground=hfg)
 
         style.configure("TButton", font=self.button_font, padding=8, relief="flat", borderwidth=1)
-        style.configure("Primary.TButton", background=t['primary'], foreground='#ffffff')
+        style.configure("Primary.TButton", background=prim, foreground='#ffffff')
         style.map("Primary.TButton",
-                  background=[("active", t['secondary'])], foreground=[("active", '#ffffff')])
+                  background=[("active", sec)], foreground=[("active", '#ffffff')])
 
-        style.configure("Accent.TButton", background=t['accent'], foreground='#ffffff')
+        style.configure("Accent.TButton", background=acc, foreground='#ffffff')
         style.map("Accent.TButton",
-                  background=[("active", t['secondary'])], foreground=[("active", '#ffffff')])
+                  background=[("active", sec)], foreground=[("active", '#ffffff')])
 
-        entry_fg = t['text_foreground']
         style.configure("TEntry",
-                        fieldbackground=t['text_background'],
-                        foreground=entry_fg,
+                        fieldbackground=tbg,
+                        foreground=tfg,
                         font=self.text_font,
                         padding=8,
                         relief="flat",
                         borderwidth=1)
 
         style.configure("Treeview",
-                        background=t['text_background'],
-                        foreground=t['text_foreground'],
-                        fieldbackground=t['text_background'],
+                        background=tbg,
+                        foreground=tfg,
+                        fieldbackground=tbg,
                         font=self.text_font)
         style.configure("Treeview.Heading",
-                        background=t['header_background'],
-                        foreground=t['header_foreground'],
+                        background=hbg,
+                        foreground=hfg,
                         font=self.button_font)
 
     def _create_widgets(self):
@@ -279,6 +578,7 @@ class ModernCrosswordApp:
         self.results_tree.heading('Score', text='Score')
         self.results_tree.heading('Definition', text='Definition')
         self.results_tree.pack(fill='both', expand=True)
+        self._result_iids = []  # Rows reused across solves
 
         # Feedback buttons
         self.feedback_button = ttk.Button(results_frame, text="Save as Feedback", style="Accent.TButton", command=self.save_feedback)
@@ -302,12 +602,25 @@ class ModernCrosswordApp:
         if not clue or not pattern:
             messagebox.showwarning("Input Error", "Please enter both clue and pattern.")
             return
-        results = self.solver.solve(clue, pattern)
+        try:
+            results = self.solver.solve(clue, pattern)
+        except RuntimeError as e:
+            messagebox.showerror("Error", str(e))
+            return
         ranked_list = results.get((clue, pattern.upper()), [])
-        for item in self.results_tree.get_children():
-            self.results_tree.delete(item)
-        for word, score, definition in ranked_list:
-            self.results_tree.insert('', 'end', values=(word, f"{score:.2f}", definition))
+        # Update rows in place and only insert/delete the difference; rows now hold other
+        # words, so drop the selection rather than let "Save as Feedback" pick one up
+        self.results_tree.selection_remove(self.results_tree.selection())
+        iids = self._result_iids
+        for i, (word, score, definition) in enumerate(ranked_list):
+            row = (word, f"{score:.2f}", definition)
+            if i < len(iids):
+                self.results_tree.item(iids[i], values=row)
+            else:
+                iids.append(self.results_tree.insert('', 'end', values=row))
+        if len(iids) > len(ranked_list):
+            self.results_tree.delete(*iids[len(ranked_list):])
+            del iids[len(ranked_list):]
 
     def save_feedback(self):
         selected = self.results_tree.selection()
@@ -388,6 +701,8 @@ Tips:
 
 if __name__ == "__main__":
     try:
+        # Import NLTK while the word list is read; the solver waits for it if needed
+        Thread(target=_ensure_nltk, daemon=True).start()
         solver = CrosswordSolver("words.txt", "feedback.json")
         app = ModernCrosswordApp(solver)
         app.run()